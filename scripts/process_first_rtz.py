@@ -1,24 +1,41 @@
 import gzip
+import os
 import re
 import json
 import requests
 from pathlib import Path
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def find_tutorial_rtz():
     """Find a tutorial RTZ file to start with"""
     
     romfs_path = Path('RomFS')
     
+    # Walk RomFS once and collect every RTZ file
+    all_rtz = []
+    stack = [romfs_path] if romfs_path.is_dir() else []
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.rtz'):
+                    all_rtz.append(Path(entry.path))
+    
     # Look for tutorial files first (easiest to translate)
     tutorial_patterns = ['tuto', 'tutorial', 'help']
     
     for pattern in tutorial_patterns:
-        matches = list(romfs_path.rglob(f'*{pattern}*.rtz'))
-        if matches:
-            return matches[0]
+        match = next((p for p in all_rtz if pattern in p.name), None)
+        if match:
+            return match
     
     # If no tutorial files, get any RTZ file
-    all_rtz = list(romfs_path.rglob('*.rtz'))
     if all_rtz:
         return all_rtz[0]
     
@@ -36,6 +53,23 @@ def decompress_rtz(rtz_path):
         print(f"❌ Failed to decompress {rtz_path.name}: {e}")
         return None
 
+def printable_ratio(text_bytes):
+    """Fraction of UTF-16LE code units that are not C0/C1 control characters"""
+    
+    u16 = np.frombuffer(text_bytes, dtype='<u2')
+    printable = (u16 >= 0x20) & ((u16 < 0x7F) | (u16 >= 0xA0))
+    return printable.mean()
+
+def is_well_formed_utf16(text_bytes):
+    """True if every UTF-16LE surrogate in text_bytes is part of a valid pair"""
+    
+    u16 = np.frombuffer(text_bytes, dtype='<u2')
+    is_lead = (u16 & 0xFC00) == 0xD800
+    is_trail = (u16 & 0xFC00) == 0xDC00
+    if is_lead[-1] or is_trail[0]:
+        return False
+    return not np.any(is_lead[:-1] != is_trail[1:])
+
 def extract_text_segments(data, start_offset=0):
     """Extract text segments from RTZ data using the project's method"""
     
@@ -68,26 +102,26 @@ def extract_text_segments(data, start_offset=0):
             pos += 1
             continue
         
-        # Try to decode as UTF-16LE
-        try:
-            text_bytes = data[text_start:text_end]
-            text = text_bytes.decode('utf-16le', errors='ignore')
+        # Reject mostly-binary candidates before paying for a decode
+        text_bytes = data[text_start:text_end]
+        if printable_ratio(text_bytes) < 0.5 or not is_well_formed_utf16(text_bytes):
+            pos += 1
+            continue
+        
+        text = text_bytes.decode('utf-16le')
+        
+        # Check if it looks like actual text
+        if len(text.strip()) > 0:
+            segments.append({
+                'offset': pos,
+                'char_count': char_count,
+                'text': text.strip()
+            })
             
-            # Check if it looks like actual text
-            if len(text.strip()) > 0 and any(c.isprintable() for c in text):
-                segments.append({
-                    'offset': pos,
-                    'char_count': char_count,
-                    'text': text.strip(),
-                    'raw_bytes': text_bytes
-                })
-                
-                print(f"📝 Found text at 0x{pos:X}: \"{text[:50]}{'...' if len(text) > 50 else ''}\"")
-                
-                pos = text_end
-            else:
-                pos += 1
-        except:
+            print(f"📝 Found text at 0x{pos:X}: \"{text[:50]}{'...' if len(text) > 50 else ''}\"")
+            
+            pos = text_end
+        else:
             pos += 1
     
     return segments
@@ -130,6 +164,19 @@ def translate_segments(segments):
     
     return segments
 
+def save_segments(segments, output_file):
+    """Write segments as a JSON array, one segment serialized at a time"""
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        if orjson is not None:
+            f.write(orjson.dumps(segments, option=orjson.OPT_INDENT_2).decode('utf-8'))
+            return
+        
+        f.write('[')
+        for i, segment in enumerate(segments):
+            f.write((',\n' if i else '\n') + json.dumps(segment, ensure_ascii=False))
+        f.write('\n]')
+
 def main():
     """Process first RTZ file"""
     
@@ -168,8 +215,7 @@ def main():
         
         # Save results
         output_file = f"rtz_translation_{rtz_file.stem}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(translated_segments, f, ensure_ascii=False, indent=2)
+        save_segments(translated_segments, output_file)
         
         print(f"\n✅ PROCESSING COMPLETE!")
         print(f"   📁 File: {rtz_file.name}")
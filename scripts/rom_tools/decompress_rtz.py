@@ -1,9 +1,50 @@
 #!/usr/bin/env python3
 import sys
-import gzip
+import zlib
 import struct
 from pathlib import Path
 
+# Tampon de sortie réutilisé d'un .rtz à l'autre (non thread-safe)
+_DECOMP_BUF = bytearray(4 * 1024 * 1024)
+_CHUNK_SIZE = 256 * 1024
+
+def _gunzip_into_buffer(gzip_blob: bytes, size_hint: int) -> memoryview:
+    """
+    Décompresse le flux GZIP dans _DECOMP_BUF et renvoie une vue sur les
+    octets écrits. La vue doit être libérée avant l'appel suivant.
+    """
+    global _DECOMP_BUF
+    # L'en-tête n'est pas vérifié : on plafonne la pré-allocation, le
+    # tampon s'agrandit plus bas si la sortie réelle est plus grande
+    size_hint = min(size_hint, len(gzip_blob) * 16)
+    if len(_DECOMP_BUF) < size_hint:
+        _DECOMP_BUF = bytearray(size_hint)
+
+    written = 0
+    pending = gzip_blob
+    # Un membre GZIP par tour, comme gzip.decompress ; les octets nuls
+    # de remplissage après le dernier membre sont ignorés
+    while pending:
+        d = zlib.decompressobj(wbits=31)
+        while not d.eof:
+            chunk = d.decompress(pending, _CHUNK_SIZE)
+            pending = d.unconsumed_tail
+            if not chunk and not pending:
+                chunk = d.flush()
+                if not chunk:
+                    break
+            end = written + len(chunk)
+            if end > len(_DECOMP_BUF):
+                _DECOMP_BUF.extend(bytes(max(end, 2 * len(_DECOMP_BUF)) - len(_DECOMP_BUF)))
+            _DECOMP_BUF[written:end] = chunk
+            written = end
+
+        if not d.eof:
+            raise zlib.error("flux GZIP tronqué")
+        # Ce qui suit n'est pas un en-tête GZIP : le membre suivant lève zlib.error
+        pending = d.unused_data.lstrip(b'\x00')
+    return memoryview(_DECOMP_BUF)[:written]
+
 def decompress_rtz(path: Path):
     data = path.read_bytes()
     # 1) Lire la taille du bloc décompressé
@@ -12,16 +53,17 @@ def decompress_rtz(path: Path):
     gzip_blob = data[4:]
     # 3) Décompression GZIP
     try:
-        raw = gzip.decompress(gzip_blob)
+        raw = _gunzip_into_buffer(gzip_blob, size)
     except Exception as e:
         print(f"❌ Erreur GZIP sur {path.name} : {e}")
         return
-    if len(raw) != size:
-        print(f"⚠ Attention : taille décompressée ({len(raw)}) ≠ header ({size})")
+    with raw:
+        if len(raw) != size:
+            print(f"⚠ Attention : taille décompressée ({len(raw)}) ≠ header ({size})")
 
-    # 4) Écrire le .bin
-    out = path.with_suffix('.bin')
-    out.write_bytes(raw)
+        # 4) Écrire le .bin
+        out = path.with_suffix('.bin')
+        out.write_bytes(raw)
     print(f"✔ Décompressé → {out.name}")
 
 def main():
@@ -8,6 +8,7 @@ Ignores RTZ compression status - focuses on direct .bin file modification
 import sys
 from pathlib import Path
 import re
+import numpy as np
 
 def search_utf16_patterns(file_path):
     """Search for UTF-16LE English patterns in binary file"""
@@ -52,27 +53,33 @@ def search_utf16_patterns(file_path):
         try:
             # Look for UTF-16LE text patterns
             sample_texts = []
-            i = 0
-            while i < len(data) - 20 and len(sample_texts) < 5:
-                # Look for potential UTF-16LE text start
-                if (data[i + 1] == 0x00 and 
-                    32 <= data[i] <= 126):  # Printable ASCII
-                    
-                    # Try to decode a chunk
-                    chunk_end = min(i + 40, len(data))
-                    try:
-                        text = data[i:chunk_end].decode('utf-16le', errors='ignore')
-                        # Filter for meaningful text (contains letters)
-                        if any(c.isalpha() for c in text) and len(text.strip()) > 3:
-                            clean_text = ''.join(c for c in text if c.isprintable())
-                            if clean_text and len(clean_text) > 3:
-                                sample_texts.append({
-                                    'position': f'0x{i:X}',
-                                    'text': clean_text[:30] + ('...' if len(clean_text) > 30 else '')
-                                })
-                    except:
-                        pass
-                i += 2  # Move by 2 bytes for UTF-16LE
+            
+            # Mark every UTF-16LE code unit that is printable ASCII, then keep
+            # only starts where most of the next 10 units are too, so decode
+            # runs on likely string starts instead of every even offset
+            u16 = np.frombuffer(data, dtype='<u2', count=len(data) // 2)
+            mask = (u16 >= 0x20) & (u16 < 0x7F)
+            run_sums = np.concatenate(([0], np.cumsum(mask)))
+            starts = np.arange(len(u16))
+            window = run_sums[np.minimum(starts + 10, len(u16))] - run_sums[starts]
+            candidates = np.flatnonzero(mask & (window > 5) & (starts * 2 < len(data) - 20))
+            
+            for unit in candidates:
+                if len(sample_texts) >= 5:
+                    break
+                i = int(unit) * 2
+                
+                # Try to decode a chunk
+                chunk_end = min(i + 40, len(data))
+                text = data[i:chunk_end].decode('utf-16le', errors='ignore')
+                # Filter for meaningful text (contains letters)
+                if any(c.isalpha() for c in text) and len(text.strip()) > 3:
+                    clean_text = ''.join(c for c in text if c.isprintable())
+                    if clean_text and len(clean_text) > 3:
+                        sample_texts.append({
+                            'position': f'0x{i:X}',
+                            'text': clean_text[:30] + ('...' if len(clean_text) > 30 else '')
+                        })
             
             results['sample_text'] = sample_texts
         except Exception as e:
@@ -2,7 +2,7 @@
 """
 Fix path issues and test with known good Japanese data
 """
-import pandas as pd
+import csv
 from pathlib import Path
 import os
 
@@ -124,17 +124,18 @@ def fix_paths_and_create_test_data():
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Create clean test dataset
-    df = pd.DataFrame(good_japanese_segments)
     test_file = output_dir / "tutorial_test_small.csv"
-    df.to_csv(test_file, index=False, encoding='utf-8')
+    with open(test_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['file', 'segment_id', 'japanese_text'], lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(good_japanese_segments)
     
     print(f"✅ Created clean test dataset: {test_file}")
-    print(f"   Contains {len(df)} segments with GOOD Japanese text")
+    print(f"   Contains {len(good_japanese_segments)} segments with GOOD Japanese text")
     
     # Show preview
     print(f"\n📝 Clean test data preview:")
-    for i in range(min(5, len(df))):
-        row = df.iloc[i]
+    for row in good_japanese_segments[:5]:
         preview = row['japanese_text'][:50] + "..." if len(row['japanese_text']) > 50 else row['japanese_text']
         print(f"  {row['file']}:{row['segment_id']} - {preview}")
     
@@ -50,7 +50,6 @@ ENGLISH_CORRECTIONS = {
     "attack": "Attack", 
     "guard": "Guard",
     "drive check": "Drive Check",
-    "Drive check": "Drive Check",
     "trigger": "Trigger",
     "fight": "Fight",
     "deck": "Deck",
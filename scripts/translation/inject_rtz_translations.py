@@ -4,46 +4,97 @@ CF Vanguard RTZ Translation Injection
 Injects translated dialogue back into tutorial RTZ files
 """
 import struct
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+import hashlib
+import json
+import mmap
+import os
 import shutil
+import sys
+
+# Optional compiled segment scanner/encoder, see rtz_fast.pyx
+try:
+    from rtz_fast import scan_segments, encode_segment
+except ImportError:
+    scan_segments = encode_segment = None
+
+# End of the text segment table, and the 4-byte prefix written before new segments
+_TERM = b'\xFF\xFF\xFF\xFF\x00'
+_PREFIX = b'\x00\x00\x00\x00'
 
 class RTZInjector:
-    def __init__(self):
-        self.TERMINATOR = b'\xFF\xFF\xFF\xFF\x00'
+    # Segment header: [4 unknown bytes] + [1 length byte]
+    _HDR = struct.Struct('<4sB')
+    # Newlines are stored as the special † character
+    _NL_TABLE = str.maketrans({'\n': '†'})
+    
+    def __init__(self, verbose: bool = False):
+        self.TERMINATOR = _TERM
+        # Log every segment, not just the per-file summary
+        self.verbose = verbose
         
     def encode_text_segment(self, text: str) -> bytes:
         """Encode English text as UTF-16LE segment"""
+        if encode_segment is not None:
+            return encode_segment(text)
+        
         if not text:
             return b''
-            
-        # Convert newlines back to special character
-        text = text.replace('\n', '†')
         
-        # Encode as UTF-16LE
-        utf16_bytes = text.encode('utf-16le')
+        # Convert newlines back to special character and encode as UTF-16LE
+        utf16_bytes = text.translate(self._NL_TABLE).encode('utf-16le')
         
-        # Calculate length in UTF-16 units (2-byte units)
-        utf16_length = len(utf16_bytes) // 2
+        # Length is in UTF-16 units (2-byte units); the prefix uses the
+        # common pattern from extracted data
+        return self._HDR.pack(_PREFIX, len(utf16_bytes) // 2) + utf16_bytes
+    
+    def encode_text_segments(self, texts: List[str]) -> List[bytes]:
+        """Encode several texts as UTF-16LE segments with a single encode call"""
+        joined = '\x1f'.join(texts)
+        
+        # The compiled encoder is already per-call cheap, and a separator
+        # inside a text would break the split below
+        if encode_segment is not None or joined.count('\x1f') != len(texts) - 1:
+            return [self.encode_text_segment(text) for text in texts]
+        
+        utf16_bytes = joined.translate(self._NL_TABLE).encode('utf-16le')
         
-        # Create segment: [4 unknown bytes] + [1 length byte] + [UTF-16 data]
-        # Using common pattern from extracted data
-        prefix = b'\x00\x00\x00\x00'  # Common prefix pattern
-        length_byte = struct.pack('B', utf16_length)
+        # Split on the separator's code unit positions, which keeps the
+        # cuts aligned to 2-byte units
+        cuts = (np.flatnonzero(np.frombuffer(utf16_bytes, dtype='<u2') == 0x1F) * 2).tolist()
+        starts = [0] + [cut + 2 for cut in cuts]
+        ends = cuts + [len(utf16_bytes)]
         
-        return prefix + length_byte + utf16_bytes
+        return [
+            self._HDR.pack(_PREFIX, (end - start) // 2) + utf16_bytes[start:end] if text else b''
+            for text, start, end in zip(texts, starts, ends)
+        ]
     
     def find_text_segments(self, data: bytes, start_offset: int = 0) -> List[Tuple[int, int, int]]:
         """Find all text segments in RTZ data
         Returns: List of (prefix_pos, content_start, content_end)
         """
+        if scan_segments is not None:
+            return scan_segments(data, start_offset)
+        
         segments = []
         pos = start_offset
+        data_len = len(data)
+        term_pos = data.find(_TERM, pos)
         
-        while pos + 5 <= len(data):
+        while pos + 5 <= data_len:
+            # A terminator match that fell inside segment content is not a
+            # boundary, look for the next one from here
+            if 0 <= term_pos < pos:
+                term_pos = data.find(_TERM, pos)
+            
             # Check for terminator
-            if data[pos:pos+5] == self.TERMINATOR:
+            if pos == term_pos:
                 break
                 
             # Read length byte
@@ -53,7 +104,7 @@ class RTZInjector:
             content_start = pos + 5
             content_end = content_start + byte_length
             
-            if content_end > len(data):
+            if content_end > data_len:
                 break
                 
             segments.append((pos, content_start, content_end))
@@ -61,82 +112,116 @@ class RTZInjector:
             
         return segments
     
-    def inject_translations(self, original_rtz: Path, translations: Dict[int, str], output_rtz: Path) -> bool:
-        """Inject translations into RTZ file"""
+    def inject_translations(self, original_rtz: Path, translations: Dict[int, str], output_rtz: Path,
+                            csv_mtime_ns: int = 0, meta_dir: Path = None) -> bool:
+        """Inject translations into RTZ file, skipping outputs that are already up to date"""
+        # Buffer this file's messages and emit them in one write, so
+        # parallel workers don't interleave lines
+        log: List[str] = []
         try:
-            # Read original RTZ
-            with open(original_rtz, 'rb') as f:
-                data = bytearray(f.read())
+            # Up to date when the output is newer than both inputs and was
+            # built from the same translations; without a meta_dir always rebuild
+            digest = hashlib.blake2b(json.dumps(sorted(translations.items()), default=str).encode()).hexdigest()
+            meta_path = meta_dir / (output_rtz.name + '.meta') if meta_dir is not None else None
+            if (meta_path is not None and output_rtz.exists() and meta_path.exists()
+                    and output_rtz.stat().st_mtime_ns > max(original_rtz.stat().st_mtime_ns, csv_mtime_ns)
+                    and meta_path.read_text() == digest):
+                log.append(f"⏭️  Up to date: {output_rtz.name}")
+                return True
             
-            print(f"📂 Processing {original_rtz.name}")
-            print(f"   Original size: {len(data):,} bytes")
-            
-            # Find existing segments
-            segments = self.find_text_segments(data)
-            print(f"   Found {len(segments)} text segments")
-            
-            if not segments:
-                print("   ⚠️  No text segments found, copying original")
-                shutil.copy2(original_rtz, output_rtz)
-                return False
-            
-            # Build new data
-            new_data = bytearray()
-            
-            # Copy data before first segment
-            if segments:
-                new_data.extend(data[:segments[0][0]])
-            
-            translated_count = 0
-            total_size_change = 0
-            
-            # Process each segment
-            for i, (prefix_pos, content_start, content_end) in enumerate(segments):
-                segment_id = i + 1
+            # Map original RTZ and find existing segments
+            with _map_rtz(original_rtz) as data:
+                segments = self.find_text_segments(data)
+                original_size = len(data)
                 
-                if segment_id in translations and translations[segment_id]:
-                    # Use translation
-                    translated_text = translations[segment_id]
-                    new_segment = self.encode_text_segment(translated_text)
-                    translated_count += 1
-                    
-                    # Size change tracking
-                    original_size = content_end - prefix_pos
-                    size_change = len(new_segment) - original_size
-                    total_size_change += size_change
-                    
-                    print(f"   [{segment_id}] Translated: {len(translated_text)} chars -> {len(new_segment)} bytes (Δ{size_change:+d})")
-                else:
-                    # Keep original
-                    new_segment = data[prefix_pos:content_end]
-                    print(f"   [{segment_id}] Kept original: {content_end - prefix_pos} bytes")
+                log.append(f"📂 Processing {original_rtz.name}")
+                log.append(f"   Original size: {original_size:,} bytes")
+                
+                log.append(f"   Found {len(segments)} text segments")
                 
-                new_data.extend(new_segment)
+                if not segments:
+                    log.append("   ⚠️  No text segments found, copying original")
+                    shutil.copy2(original_rtz, output_rtz)
+                    return False
                 
-                # Copy data between segments
-                if i < len(segments) - 1:
-                    next_start = segments[i + 1][0]
-                    new_data.extend(data[content_end:next_start])
+                # Encode up front so nothing can raise while views of the
+                # mapping are alive
+                wanted = {
+                    segment_id: text
+                    for segment_id, text in translations.items()
+                    if 1 <= segment_id <= len(segments) and text
+                }
+                encoded = dict(zip(wanted, self.encode_text_segments(list(wanted.values()))))
+                new_data = self._rebuild(data, segments, translations, encoded, log)
             
-            # Copy remaining data after last segment
-            if segments:
-                last_end = segments[-1][2]
-                new_data.extend(data[last_end:])
+            translated_count = len(encoded)
+            total_size_change = len(new_data) - original_size
             
-            # Write new RTZ file
-            with open(output_rtz, 'wb') as f:
-                f.write(new_data)
+            # Write new RTZ file straight to the OS, no stdio buffer
+            with open(output_rtz, 'wb', buffering=0) as f:
+                remaining = memoryview(new_data)
+                while remaining:  # raw writes may be partial
+                    remaining = remaining[f.write(remaining):]
+                
+                # Write-once output, don't keep large files in the page cache
+                if len(new_data) > 1024 * 1024 and hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            
+            if meta_path is not None:
+                meta_path.parent.mkdir(parents=True, exist_ok=True)
+                meta_path.write_text(digest)
             
-            print(f"   ✅ Saved: {len(new_data):,} bytes (Δ{total_size_change:+d})")
-            print(f"   📊 Translated: {translated_count}/{len(segments)} segments")
+            log.append(f"   ✅ Saved: {len(new_data):,} bytes (Δ{total_size_change:+d})")
+            log.append(f"   📊 Translated: {translated_count}/{len(segments)} segments")
             
             return True
             
         except Exception as e:
-            print(f"   ❌ Error injecting {original_rtz.name}: {e}")
+            log.append(f"   ❌ Error injecting {original_rtz.name}: {e}")
             return False
+        
+        finally:
+            sys.stdout.write('\n'.join(log) + '\n')
+            sys.stdout.flush()
     
-    def process_all_tutorials(self, translations_csv: Path, tutorial_bin_dir: Path, output_dir: Path):
+    def _rebuild(self, data, segments, translations: Dict[int, str], encoded: Dict[int, bytes], log: List[str]) -> bytes:
+        """Splice encoded segments into data, keeping everything else as is"""
+        # Collect output chunks and join them once; slices of the view
+        # are not copied until the join. bytes.join sums the chunk sizes
+        # first, allocates the exact output once and memcpys each chunk in,
+        # so a presized bytearray would only add a zero-fill pass
+        view = memoryview(data)
+        parts: List[bytes] = []
+        
+        # Kept segments and the gaps around them are never touched, so copy
+        # everything between two translated segments as one slice
+        copy_from = 0
+        
+        # Process each segment
+        for i, (prefix_pos, content_start, content_end) in enumerate(segments):
+            segment_id = i + 1
+            
+            if segment_id in encoded:
+                # Use translation
+                new_segment = encoded[segment_id]
+                parts.append(view[copy_from:prefix_pos])
+                parts.append(new_segment)
+                copy_from = content_end
+                
+                if self.verbose:
+                    # Size change tracking
+                    size_change = len(new_segment) - (content_end - prefix_pos)
+                    log.append(f"   [{segment_id}] Translated: {len(translations[segment_id])} chars -> {len(new_segment)} bytes (Δ{size_change:+d})")
+            elif self.verbose:
+                # Keep original
+                log.append(f"   [{segment_id}] Kept original: {content_end - prefix_pos} bytes")
+        
+        # Copy remaining data after last translated segment
+        parts.append(view[copy_from:])
+        
+        return b''.join(parts)
+    
+    def process_all_tutorials(self, translations_csv: Path, tutorial_bin_dir: Path, output_dir: Path, jobs: int = None):
         """Process all tutorial files with translations"""
         print("🎮 CF Vanguard RTZ Translation Injection")
         print("=" * 50)
@@ -147,58 +232,73 @@ class RTZInjector:
             return
         
         print(f"📊 Loading translations from {translations_csv}")
-        df = pd.read_csv(translations_csv)
+        # Only the columns used below; status and tier have a handful of
+        # values, so store them as categoricals
+        usecols = ['file', 'segment_id', 'english_translation', 'status', 'quality_tier']
+        try:
+            df = pd.read_csv(translations_csv, engine='pyarrow', usecols=usecols)
+        except ImportError:
+            df = pd.read_csv(translations_csv, usecols=usecols)
+        df = df.astype({'status': 'category', 'quality_tier': 'category'})
         
-        # Filter for translated content only
-        df_translated = df[
-            (df['status'] == 'TRANSLATED') & 
-            (df['quality_tier'].isin(['HIGH', 'MEDIUM']))
-        ].copy()
+        # Filter for translated content only, comparing category codes
+        # rather than strings
+        status = df['status'].cat
+        tier = df['quality_tier'].cat
+        translated_codes = [status.categories.get_loc(x) for x in ['TRANSLATED'] if x in status.categories]
+        tier_codes = [tier.categories.get_loc(x) for x in ['HIGH', 'MEDIUM'] if x in tier.categories]
+        mask = np.isin(status.codes.to_numpy(), translated_codes) & np.isin(tier.codes.to_numpy(), tier_codes)
+        df_translated = df[mask]
         
         print(f"   Found {len(df_translated)} high-quality translations")
         
         # Group by file
-        file_translations = {}
-        for _, row in df_translated.iterrows():
-            file_name = row['file']
-            segment_id = row['segment_id'] 
-            translation = row['english_translation']
-            
-            if file_name not in file_translations:
-                file_translations[file_name] = {}
-            
-            file_translations[file_name][segment_id] = translation
+        file_translations = {
+            file_name: dict(zip(group['segment_id'], group['english_translation']))
+            for file_name, group in df_translated.groupby('file', sort=False)
+        }
         
         print(f"   Translations for {len(file_translations)} files")
         
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Process each tutorial file
+        csv_mtime_ns = translations_csv.stat().st_mtime_ns
+        # Digest sidecars live next to the translations, outside the modified romfs
+        meta_dir = translations_csv.parent / "_inject_meta" / output_dir.name
+        
+        # Process each tutorial file; files are independent, so inject them
+        # in parallel worker processes
         processed_files = 0
         successful_files = 0
         
-        for file_name, translations in file_translations.items():
-            # Convert .txt file name back to .bin
-            bin_name = file_name.replace('.txt', '.bin')
-            original_bin = tutorial_bin_dir / bin_name
-            output_bin = output_dir / bin_name
-            
-            if not original_bin.exists():
-                print(f"⚠️  Original file not found: {original_bin}")
-                continue
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = []
+            for file_name, translations in file_translations.items():
+                # Convert .txt file name back to .bin
+                bin_name = file_name.replace('.txt', '.bin')
+                original_bin = tutorial_bin_dir / bin_name
+                output_bin = output_dir / bin_name
                 
-            processed_files += 1
+                if not original_bin.exists():
+                    print(f"⚠️  Original file not found: {original_bin}")
+                    continue
+                    
+                processed_files += 1
+                futures.append(executor.submit(self.inject_translations, original_bin, translations, output_bin,
+                                               csv_mtime_ns, meta_dir))
             
-            if self.inject_translations(original_bin, translations, output_bin):
-                successful_files += 1
+            for future in as_completed(futures):
+                if future.result():
+                    successful_files += 1
         
         # Copy untranslated files
         print(f"\n📋 Copying untranslated tutorial files...")
-        for bin_file in tutorial_bin_dir.glob("*.bin"):
-            output_file = output_dir / bin_file.name
-            if not output_file.exists():
-                shutil.copy2(bin_file, output_file)
+        written = {p.name for p in output_dir.iterdir()}
+        for bin_file in tutorial_bin_dir.iterdir():
+            if bin_file.suffix == '.bin' and bin_file.name not in written:
+                # makerom doesn't need the metadata, plain copyfile is enough
+                shutil.copyfile(bin_file, output_dir / bin_file.name)
                 print(f"   📄 Copied: {bin_file.name}")
         
         # Summary
@@ -216,11 +316,25 @@ class RTZInjector:
         else:
             print(f"\n❌ No files successfully processed")
 
+@contextmanager
+def _map_rtz(path: Path):
+    """Map an RTZ file read-only; empty files yield b'' since mmap rejects them"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            yield data
+
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Inject translated dialogue into RTZ files')
     parser.add_argument('--test', action='store_true', help='Use small test dataset instead of full dataset')
+    parser.add_argument('--verbose', action='store_true', help='Log every segment, not just per-file summaries')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Number of files to inject in parallel')
     args = parser.parse_args()
     
     # Paths
@@ -236,8 +350,8 @@ def main():
         output_dir = Path("modified/romfs/fe")    # Full translated .bin files
         print("🎯 FULL MODE - Processing complete dataset")
     
-    injector = RTZInjector()
-    injector.process_all_tutorials(translations_file, tutorial_bins, output_dir)
+    injector = RTZInjector(verbose=args.verbose)
+    injector.process_all_tutorials(translations_file, tutorial_bins, output_dir, jobs=args.jobs)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
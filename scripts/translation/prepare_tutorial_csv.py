@@ -7,41 +7,38 @@ import re
 import pandas as pd
 from pathlib import Path
 
+# File section headers and the [N] segments inside them
+FILE_RE = re.compile(r'=== (\w+\.bin) \(\d+ segments\) ===')
+SEG_RE = re.compile(r'\[(\d+)\]\s*(.*?)(?=\n\[\d+\]|\n===|\Z)', re.DOTALL)
+
 def parse_tutorial_file(file_path: Path) -> list:
-    """Parse the all_tutorial_japanese.txt file into structured data"""
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Split by file sections (=== filename.bin ===)
-    file_sections = re.split(r'=== (\w+\.bin) \(\d+ segments\) ===', content)
+    """Parse the all_tutorial_japanese.txt file into (file, segment_id, japanese_text) rows"""
     
     data = []
-    current_file = None
     
-    for i, section in enumerate(file_sections):
-        if i == 0:
-            continue  # Skip the first empty section
+    def flush_section(current_file, section_lines):
+        for seg in SEG_RE.finditer(''.join(section_lines)):
+            text = seg.group(2).strip()
             
-        if i % 2 == 1:  # Odd indices are filenames
-            current_file = section
-        else:  # Even indices are content
-            if current_file is None:
-                continue
-                
-            # Extract segments with [X] pattern
-            segments = re.findall(r'\[(\d+)\]\s*([^\[]*?)(?=\[\d+\]|$)', section, re.DOTALL)
-            
-            for seg_id_str, text in segments:
-                seg_id = int(seg_id_str)
-                text = text.strip()
-                
-                if text:  # Only include non-empty segments
-                    data.append({
-                        'file': current_file,
-                        'segment_id': seg_id,
-                        'japanese_text': text
-                    })
+            if text:  # Only include non-empty segments
+                data.append((current_file, int(seg.group(1)), text))
+    
+    # Stream the file and parse one section at a time (=== filename.bin ===)
+    current_file = None
+    section_lines = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            header = FILE_RE.match(line)
+            if header:
+                if current_file is not None:
+                    flush_section(current_file, section_lines)
+                current_file = header.group(1)
+                section_lines = []
+            elif current_file is not None:
+                section_lines.append(line)
+    
+    if current_file is not None:
+        flush_section(current_file, section_lines)
     
     return data
 
@@ -68,7 +65,7 @@ def main():
         return
     
     # Create DataFrame
-    df = pd.DataFrame(data)
+    df = pd.DataFrame.from_records(data, columns=['file', 'segment_id', 'japanese_text'])
     
     # Statistics
     file_counts = df['file'].value_counts()
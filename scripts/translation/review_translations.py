@@ -41,26 +41,33 @@ VANGUARD_CORRECTIONS = {
     "phase": "Phase"
 }
 
-def apply_vanguard_corrections(text: str) -> str:
-    """Apply Vanguard-specific corrections to translated text"""
-    if not text:
-        return text
-    
-    # Apply corrections with word boundaries
-    for wrong, correct in VANGUARD_CORRECTIONS.items():
-        pattern = r'\b' + re.escape(wrong) + r'\b'
-        text = re.sub(pattern, correct, text, flags=re.IGNORECASE)
-    
-    # Fix common formatting issues
-    text = text.replace('。', '.')  # Japanese period
-    text = text.replace(' 、', ',')  # Japanese comma spacing
-    text = re.sub(r'\s+', ' ', text)  # Multiple spaces
-    text = text.strip()
-    
-    # Clean up incomplete Vanguard syntax
-    text = re.sub(r'<\s*\|\s*[^|]*\s*\|\s*[^>]*>', '', text)  # Remove incomplete <|x|y|> tags
-    
-    return text
+# All corrections as one alternation, longest term first so "drop zones"
+# wins over "drop zone"
+_CORRECTIONS_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(k) for k in sorted(VANGUARD_CORRECTIONS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+_CORRECTIONS_LOOKUP = {k.lower(): v for k, v in VANGUARD_CORRECTIONS.items()}
+_WS_RE = re.compile(r'\s+')
+_INCOMPLETE_TAG_RE = re.compile(r'<\s*\|\s*[^|]*\s*\|\s*[^>]*>')
+
+def _correct_term(match: re.Match) -> str:
+    return _CORRECTIONS_LOOKUP[match.group(0).lower()]
+
+def apply_vanguard_corrections_column(series: pd.Series) -> pd.Series:
+    """Apply Vanguard-specific corrections to a column of translated text"""
+    return (
+        series.fillna('')
+        # Apply corrections with word boundaries
+        .str.replace(_CORRECTIONS_RE, _correct_term, regex=True)
+        # Fix common formatting issues
+        .str.replace('。', '.', regex=False)  # Japanese period
+        .str.replace(' 、', ',', regex=False)  # Japanese comma spacing
+        .str.replace(_WS_RE, ' ', regex=True)  # Multiple spaces
+        .str.strip()
+        # Clean up incomplete Vanguard syntax
+        .str.replace(_INCOMPLETE_TAG_RE, '', regex=True)  # Remove incomplete <|x|y|> tags
+    )
 
 def review_test_translations():
     """Review and improve the test translation results"""
@@ -80,7 +87,7 @@ def review_test_translations():
     
     # Apply improved corrections
     print(f"\n🔧 Applying Vanguard term corrections...")
-    df['english_improved'] = df['english_translation'].apply(apply_vanguard_corrections)
+    df['english_improved'] = apply_vanguard_corrections_column(df['english_translation'])
     
     # Show before/after examples
     print(f"\n📝 BEFORE/AFTER CORRECTIONS:")
@@ -0,0 +1,45 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled fast path for inject_rtz_translations.py
+Build in place with: cythonize -i scripts/translation/rtz_fast.pyx
+The injector falls back to its pure Python code when this isn't built
+"""
+from cpython.unicode cimport PyUnicode_AsEncodedString
+from libc.string cimport memcmp
+import struct
+
+cdef bytes TERMINATOR = b'\xFF\xFF\xFF\xFF\x00'
+_HDR = struct.Struct('<4sB')
+
+cpdef list scan_segments(const unsigned char[::1] data, Py_ssize_t start_offset=0):
+    """Find all text segments, returns list of (prefix_pos, content_start, content_end)"""
+    cdef Py_ssize_t n = data.shape[0]
+    cdef Py_ssize_t pos = start_offset
+    cdef Py_ssize_t content_start, content_end
+    cdef const char *term = TERMINATOR
+    cdef list segments = []
+
+    while pos + 5 <= n:
+        # Check for terminator
+        if memcmp(&data[pos], term, 5) == 0:
+            break
+
+        # 5th byte is the length in UTF-16 units
+        content_start = pos + 5
+        content_end = content_start + data[pos + 4] * 2
+
+        if content_end > n:
+            break
+
+        segments.append((pos, content_start, content_end))
+        pos = content_end
+
+    return segments
+
+cpdef bytes encode_segment(str text):
+    """Encode text as [4 zero bytes] + [length byte] + [UTF-16LE data]"""
+    if not text:
+        return b''
+
+    cdef bytes utf16 = PyUnicode_AsEncodedString(text.replace('\n', '†'), "utf-16le", NULL)
+    return _HDR.pack(b'\x00\x00\x00\x00', len(utf16) // 2) + utf16
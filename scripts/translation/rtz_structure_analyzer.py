@@ -5,6 +5,7 @@ Finds where actual dialogue text is located in the .bin files
 
 import sys
 from pathlib import Path
+import numpy as np
 
 def find_text_segments(file_path):
     """Find text segments using the 5-byte prefix pattern"""
@@ -25,6 +26,7 @@ def find_text_segments(file_path):
         print(f"🔍 Searching for text segments from 0x{search_start:X} to 0x{terminator_pos:X}")
         
         segments_found = []
+        segment_log = []  # written in one go after the scan
         pos = search_start
         
         while pos < terminator_pos - 5:
@@ -52,12 +54,14 @@ def find_text_segments(file_path):
                                     'text': text.strip()[:50]  # First 50 chars
                                 })
                                 
-                                print(f"📝 Segment at 0x{pos:X}: len={length_byte} → '{text.strip()[:50]}'")
+                                segment_log.append(f"📝 Segment at 0x{pos:X}: len={length_byte} → '{text.strip()[:50]}'")
                         except:
                             pass
             
             pos += 1
         
+        if segment_log:
+            sys.stdout.write('\n'.join(segment_log) + '\n')
         print(f"\n📊 Found {len(segments_found)} potential text segments")
         return segments_found
     else:
@@ -67,24 +71,29 @@ def find_text_segments(file_path):
         print("🔍 Scanning for UTF-16LE text patterns...")
         
         text_patterns = []
-        for i in range(0, len(data) - 10, 2):
-            if data[i + 1] == 0x00 and 32 <= data[i] <= 126:  # Potential UTF-16LE
-                # Check if this starts a longer text sequence
-                try:
-                    chunk = data[i:i+40]
-                    text = chunk.decode('utf-16le', errors='ignore')
-                    clean_text = ''.join(c for c in text if c.isprintable()).strip()
-                    
-                    if len(clean_text) > 5 and not clean_text.startswith('.'):
-                        text_patterns.append({
-                            'position': i,
-                            'text': clean_text[:30]
-                        })
-                        
-                        if len(text_patterns) <= 10:  # Show first 10
-                            print(f"📝 Text at 0x{i:X}: '{clean_text[:30]}'")
-                except:
-                    pass
+        
+        # Mark printable ASCII UTF-16LE code units and find the runs of them
+        u16 = np.frombuffer(data, dtype='<u2', count=len(data) // 2)
+        mask = (u16 >= 0x20) & (u16 <= 0x7E)
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.view(np.int8), [0]))))
+        run_starts, run_ends = edges[::2], edges[1::2]
+        
+        # Decode each run long enough to hold more than 5 characters once
+        for start, end in zip(run_starts.tolist(), run_ends.tolist()):
+            if end - start <= 5:
+                continue
+            
+            i = start * 2
+            clean_text = data[i:end * 2].decode('utf-16le').strip()
+            
+            if len(clean_text) > 5 and not clean_text.startswith('.'):
+                text_patterns.append({
+                    'position': i,
+                    'text': clean_text[:30]
+                })
+                
+                if len(text_patterns) <= 10:  # Show first 10
+                    print(f"📝 Text at 0x{i:X}: '{clean_text[:30]}'")
         
         print(f"\n📊 Found {len(text_patterns)} text patterns")
         return text_patterns
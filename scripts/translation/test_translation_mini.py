@@ -54,23 +54,34 @@ VANGUARD_TERMS = {
     "ユニット": "Unit"
 }
 
+_FURIGANA_RE = re.compile(r'<\|([^|]+)\|[^|]*\|>')
+_COLOR_RE = re.compile(r'\{\$[0-9A-Fa-f]*\}')
+
+# The connection check and the test translations run one after another
+# over this one keep-alive connection; no retries, so failures show as-is
+SESSION = requests.Session()
+
 class MiniTranslator:
-    def __init__(self, api_url="http://localhost:5001"):
+    def __init__(self, api_url="http://localhost:5001", session=SESSION):
         self.api_url = api_url
+        self.session = session
         self.terms_dict = VANGUARD_TERMS
+        self._cache = {}
         
     def clean_text(self, text: str) -> str:
         """Basic cleaning"""
         # Remove <|kanji|kana|> -> kanji
-        text = re.sub(r'<\|([^|]+)\|[^|]*\|>', r'\1', text)
+        text = _FURIGANA_RE.sub(r'\1', text)
         # Remove color tags
-        text = re.sub(r'\{\$[0-9A-Fa-f]*\}', '', text)
+        text = _COLOR_RE.sub('', text)
         return text.strip()
     
     def translate(self, japanese_text: str) -> str:
         """Translate with LibreTranslate + Vanguard terms"""
+        if japanese_text in self._cache:
+            return self._cache[japanese_text]
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/translate",
                 headers={"Content-Type": "application/json"},
                 json={
@@ -87,6 +98,7 @@ class MiniTranslator:
                 # Apply Vanguard terminology
                 for jp_term, en_term in self.terms_dict.items():
                     translated = translated.replace(jp_term, en_term)
+                self._cache[japanese_text] = translated
                 return translated
             else:
                 return f"[API Error: {response.status_code}]"
@@ -98,7 +110,7 @@ def test_libretranslate_connection():
     """Test if LibreTranslate API is working"""
     print("🔗 Testing LibreTranslate connection...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:5001/translate",
             headers={"Content-Type": "application/json"},
             json={"q": "こんにちは", "source": "ja", "target": "en"},
@@ -3,14 +3,24 @@
 CF Vanguard Tutorial Translation Pipeline
 Translates extracted tutorial dialogue using LibreTranslate + Vanguard terminology
 """
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import csv
 import json
+import os
 import re
-import time
 from pathlib import Path
 from typing import Dict, List
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 # Vanguard-specific term mappings (expand from your card_list_jap_enriched.json)
 VANGUARD_TERMS = {
     # Core game terms
@@ -79,87 +89,242 @@ VANGUARD_TERMS = {
     "情報": "Information"
 }
 
+# All terms in one pass, longest first so "ドライブチェック" wins over shorter overlaps
+_TERM_RE = re.compile('|'.join(re.escape(k) for k in sorted(VANGUARD_TERMS, key=len, reverse=True)))
+
+# Cleaning and quality patterns, compiled once for every row
+_CTRL_RE = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]')
+# Control characters and <|kanji|kana|> furigana in one pass. Control
+# characters are stripped before tags are recognised, so the furigana tag
+# allows them anywhere between its delimiters
+_C = r'\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F'
+_MARKUP_RE = re.compile(
+    rf'(?P<ctrl>[{_C}]+)'
+    rf'|<[{_C}]*\|(?P<kanji>[{_C}]*[^|{_C}][^|]*)\|[^|]*\|[{_C}]*>'
+)
+# Color tags go in a pass of their own, after furigana is unwrapped: a tag
+# can sit inside a furigana kanji, or only close once one is unwrapped
+_COLOR_RE = re.compile(r'\{\$[0-9A-Fa-f]*\}')
+_WS_RE = re.compile(r'\s+')
+_JP_CHAR_RE = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]')
+_CTRL_CHAR_RE = re.compile(r'[\x00-\x1F\x7F-\x9F]')
+
+def _markup_sub(m):
+    """Furigana keeps its kanji, control characters are dropped"""
+    kanji = m.group('kanji')
+    return _CTRL_RE.sub('', kanji) if kanji else ''
+
+# Default session for VanguardTranslator: pooled keep-alive connections
+# for the batch requests, with 502/503/504 retried (a translate POST can
+# safely be sent twice)
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      allowed_methods=frozenset(['POST']), raise_on_status=False)
+))
+
+# Columns of the translated CSV, in order
+RESULT_COLUMNS = ['file', 'segment_id', 'japanese_original', 'japanese_cleaned', 'english_translation',
+                  'quality_score', 'quality_tier', 'status']
+
 class VanguardTranslator:
-    def __init__(self, api_url="http://localhost:5001"):
+    def __init__(self, api_url="http://localhost:5001", batch_size=50, concurrency=8, session=SESSION):
         self.api_url = api_url
-        self.session = requests.Session()
+        self.session = session
         self.terms_dict = VANGUARD_TERMS
+        # Lines sent per request, LibreTranslate accepts an array for q
+        self.batch_size = batch_size
+        # Batch requests in flight at once when aiohttp is available
+        self.concurrency = concurrency
+        # Cleaned Japanese text -> translation, tutorial text repeats a lot
+        self._cache = {}
+        # Translations taken from a previous output CSV; used like the cache
+        # but never written back to the cache file
+        self._seeded = {}
         
     def clean_japanese_text(self, text: str) -> str:
         """Clean Japanese text for translation"""
         if not text or not isinstance(text, str):
             return ""
             
-        # Remove control characters but preserve newlines
-        text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F-\x9F]', '', text)
-        
-        # Clean Vanguard-specific formatting
-        # <|kanji|kana|> -> kanji only  
-        text = re.sub(r'<\|([^|]+)\|[^|]*\|>', r'\1', text)
+        # Remove control characters, furigana <|kanji|kana|> -> kanji only
+        text = _MARKUP_RE.sub(_markup_sub, text)
         
         # Remove color tags {$123456} and {$}
-        text = re.sub(r'\{\$[0-9A-Fa-f]*\}', '', text)
+        text = _COLOR_RE.sub('', text)
         
         # Replace special punctuation
         text = text.replace('､', '、').replace('｡', '。')
         text = text.replace('†', '\n')  # Special newline character
         
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         
         return text
     
+    def clean_japanese_column(self, series: pd.Series) -> pd.Series:
+        """Same cleaning as clean_japanese_text, applied to a whole column at once"""
+        return (series.fillna('').astype(str)
+                .str.replace(_MARKUP_RE, _markup_sub, regex=True)
+                .str.replace(_COLOR_RE, '', regex=True)
+                .str.replace('､', '、', regex=False)
+                .str.replace('｡', '。', regex=False)
+                .str.replace('†', '\n', regex=False)
+                .str.replace(_WS_RE, ' ', regex=True)
+                .str.strip())
+    
     def apply_vanguard_terminology(self, text: str) -> str:
         """Apply Vanguard-specific term replacements"""
-        for jp_term, en_term in self.terms_dict.items():
-            text = text.replace(jp_term, en_term)
-        return text
+        return _TERM_RE.sub(lambda m: self.terms_dict[m.group(0)], text)
     
-    def translate_text(self, japanese_text: str) -> str:
-        """Translate Japanese text to English"""
-        if not japanese_text or len(japanese_text.strip()) < 2:
-            return ""
-            
+    @staticmethod
+    def _payload(q):
+        """LibreTranslate request body; q may be a string or a list of strings"""
+        return {
+            "q": q,
+            "source": "ja", 
+            "target": "en",
+            "format": "text"
+        }
+    
+    def _post(self, q):
+        """POST one LibreTranslate request"""
+        return self.session.post(
+            f"{self.api_url}/translate",
+            headers={"Content-Type": "application/json"},
+            json=self._payload(q),
+            timeout=30
+        )
+    
+    def _translate_chunk(self, chunk: List[str]):
+        """Translate one batch of strings into the cache"""
         try:
-            # Preserve newlines
-            lines = japanese_text.split('\n')
-            translated_lines = []
+            response = self._post(chunk)
             
-            for line in lines:
-                if not line.strip():
-                    translated_lines.append("")
-                    continue
-                    
-                # Translate via LibreTranslate
-                response = self.session.post(
-                    f"{self.api_url}/translate",
-                    headers={"Content-Type": "application/json"},
-                    json={
-                        "q": line.strip(),
-                        "source": "ja", 
-                        "target": "en",
-                        "format": "text"
-                    },
-                    timeout=30
-                )
-                
+            translated = response.json().get("translatedText") if response.status_code == 200 else None
+            if isinstance(translated, list) and len(translated) == len(chunk):
+                # Apply Vanguard terminology
+                for line, text in zip(chunk, translated):
+                    self._cache[line] = self.apply_vanguard_terminology(text)
+                return
+            
+            print(f"Translation failed: {response.status_code}")
+            if not 400 <= response.status_code < 500:
+                return
+            
+            # The batch itself was rejected, retry line by line
+            for line in chunk:
+                response = self._post(line)
                 if response.status_code == 200:
                     translated = response.json().get("translatedText", "")
-                    # Apply Vanguard terminology
-                    translated = self.apply_vanguard_terminology(translated)
-                    translated_lines.append(translated)
+                    self._cache[line] = self.apply_vanguard_terminology(translated)
                 else:
                     print(f"Translation failed: {response.status_code}")
-                    translated_lines.append(line)  # Keep original on failure
                     
-                # Rate limiting
-                time.sleep(0.1)
-                
-            return '\n'.join(translated_lines)
-            
         except Exception as e:
             print(f"Translation error: {e}")
-            return japanese_text  # Return original on error
+    
+    async def _translate_chunk_async(self, session, sem, chunk: List[str], retries=3):
+        """Async version of _translate_chunk, retrying 5xx answers with backoff"""
+        url = f"{self.api_url}/translate"
+        async with sem:
+            try:
+                for attempt in range(retries):
+                    async with session.post(url, json=self._payload(chunk)) as response:
+                        status = response.status
+                        translated = (await response.json()).get("translatedText") if status == 200 else None
+                    
+                    if isinstance(translated, list) and len(translated) == len(chunk):
+                        # Apply Vanguard terminology
+                        for line, text in zip(chunk, translated):
+                            self._cache[line] = self.apply_vanguard_terminology(text)
+                        return
+                    
+                    print(f"Translation failed: {status}")
+                    if status < 500:
+                        break
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                
+                if not 400 <= status < 500:
+                    return
+                
+                # The batch itself was rejected, retry line by line
+                for line in chunk:
+                    async with session.post(url, json=self._payload(line)) as response:
+                        if response.status == 200:
+                            translated = (await response.json()).get("translatedText", "")
+                            self._cache[line] = self.apply_vanguard_terminology(translated)
+                        else:
+                            print(f"Translation failed: {response.status}")
+                            
+            except Exception as e:
+                print(f"Translation error: {e}")
+    
+    async def translate_batch_async(self, batches: List[List[str]]):
+        """Translate several batches of strings concurrently into the cache"""
+        sem = asyncio.Semaphore(self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            await asyncio.gather(*[self._translate_chunk_async(session, sem, b) for b in batches])
+    
+    def translate_batches(self, batches: List[List[str]]):
+        """Blocking wrapper around translate_batch_async"""
+        asyncio.run(self.translate_batch_async(batches))
+    
+    def _translate_strings(self, lines: List[str]) -> List[str]:
+        """Translate strings in batched array requests, keeping the original on failure"""
+        # Only send strings we haven't translated before, once each
+        pending = [line for line in dict.fromkeys(lines) if line not in self._cache and line not in self._seeded]
+        chunks = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        
+        if aiohttp is not None and len(chunks) > 1:
+            self.translate_batches(chunks)
+        else:
+            for chunk in chunks:
+                self._translate_chunk(chunk)
+        
+        # Strings that failed aren't cached and keep their original text
+        return [self._cache.get(line, self._seeded.get(line, line)) for line in lines]
+    
+    def load_cache(self, cache_file: Path):
+        """Load translations saved by a previous run"""
+        if cache_file.exists():
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                try:
+                    cache = json.load(f)
+                except json.JSONDecodeError as e:
+                    print(f"⚠️  Ignoring unreadable cache {cache_file}: {e}")
+                    return
+            # A text that maps to itself is a failed request, not a translation
+            self._cache.update((k, v) for k, v in cache.items() if k != v)
+    
+    def seed_cache(self, translations):
+        """Reuse (japanese, english) pairs from a previous run for this run only"""
+        self._seeded.update((k, v) for k, v in translations if k != v)
+    
+    def save_cache(self, cache_file: Path):
+        """Save translations so a restarted run doesn't request them again"""
+        # Write beside the cache and swap it in, so a run stopped mid-write
+        # leaves the previous cache intact
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self._cache, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    
+    def translate_texts(self, texts: List[str]) -> List[str]:
+        """Translate Japanese texts to English, sending them in as few requests as possible"""
+        # Each text goes out whole; clean_japanese_text has already folded
+        # its line breaks into spaces, so there are no lines to keep apart
+        wanted = [text for text in texts if text and len(text.strip()) >= 2]
+        translated = dict(zip(wanted, self._translate_strings(wanted)))
+        
+        return [translated.get(text, "") if text else "" for text in texts]
+    
+    def translate_text(self, japanese_text: str) -> str:
+        """Translate Japanese text to English"""
+        return self.translate_texts([japanese_text])[0]
     
     def assess_quality(self, text: str) -> float:
         """Assess text quality (0.0 = garbage, 1.0 = perfect)"""
@@ -167,7 +332,7 @@ class VanguardTranslator:
             return 0.0
             
         # Count Japanese characters vs total
-        japanese_chars = len(re.findall(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]', text))
+        japanese_chars = len(_JP_CHAR_RE.findall(text))
         total_chars = len(text.strip())
         
         if total_chars == 0:
@@ -176,24 +341,98 @@ class VanguardTranslator:
         japanese_ratio = japanese_chars / total_chars
         
         # Penalize control characters and corrupted content
-        control_chars = len(re.findall(r'[\x00-\x1F\x7F-\x9F]', text))
+        control_chars = len(_CTRL_CHAR_RE.findall(text))
         corruption_penalty = min(control_chars / total_chars, 0.5)
         
         # Boost score for Vanguard terms
-        vanguard_bonus = 0.0
-        for term in self.terms_dict.keys():
-            if term in text:
-                vanguard_bonus += 0.1
-        vanguard_bonus = min(vanguard_bonus, 0.3)
+        vanguard_bonus = min(len(_TERM_RE.findall(text)) * 0.1, 0.3)
         
         quality = japanese_ratio - corruption_penalty + vanguard_bonus
         return max(0.0, min(1.0, quality))
 
+    def assess_quality_column(self, series: pd.Series) -> pd.Series:
+        """Same scoring as assess_quality, applied to a whole column of cleaned text"""
+        total_chars = series.str.strip().str.len()
+        # Empty text scores 0, avoid dividing by zero
+        safe_total = total_chars.where(total_chars > 0, 1)
+        
+        japanese_ratio = series.str.count(_JP_CHAR_RE) / safe_total
+        corruption_penalty = (series.str.count(_CTRL_CHAR_RE) / safe_total).clip(upper=0.5)
+        
+        # Boost score for Vanguard terms, 0.1 per term match
+        vanguard_bonus = (series.str.count(_TERM_RE) * 0.1).clip(upper=0.3)
+        
+        quality = (japanese_ratio - corruption_penalty + vanguard_bonus).clip(0.0, 1.0)
+        return quality.where(total_chars > 0, 0.0)
+
+def _trim_partial_row(path: Path):
+    """Cut a half-written last row left by a crash so appended rows start on a fresh line"""
+    with open(path, 'rb+') as f:
+        consumed = 0
+        last_line = b''
+        
+        def lines():
+            nonlocal consumed, last_line
+            for line in f:
+                consumed += len(line)
+                last_line = line
+                yield line.decode('utf-8', errors='replace')
+        
+        # Quoted fields can hold newlines, so let csv decide where records end;
+        # strict makes a quote left open by the crash raise instead of passing
+        complete = 0
+        try:
+            for _ in csv.reader(lines(), strict=True):
+                if last_line.endswith(b'\n'):
+                    complete = consumed
+        except csv.Error:
+            pass
+        f.truncate(complete)
+
+def load_previous_results(output_file: Path, translator: VanguardTranslator) -> set:
+    """(file, segment_id) keys already in the output CSV; their translations seed the translator"""
+    if not output_file.exists():
+        return set()
+    _trim_partial_row(output_file)
+    if output_file.stat().st_size == 0:
+        return set()
+    
+    previous = pd.read_csv(output_file, usecols=['file', 'segment_id', 'japanese_cleaned',
+                                                 'english_translation', 'status'])
+    # Failed requests are written as TRANSLATED with the Japanese left in
+    # place; those rows aren't done, so drop them and request them again
+    translated = (previous['status'] == 'TRANSLATED') & previous['japanese_cleaned'].notna()
+    english = previous['english_translation']
+    failed = translated & ((english == previous['japanese_cleaned']) |
+                           (english.isna() & (previous['japanese_cleaned'].str.strip().str.len() >= 2)))
+    if failed.any():
+        _drop_rows(output_file, set(np.flatnonzero(failed.to_numpy())))
+        print(f"🔁 Retrying {int(failed.sum())} segments whose translation failed last run")
+    
+    kept = translated & ~failed
+    translator.seed_cache(zip(previous.loc[kept, 'japanese_cleaned'],
+                              previous.loc[kept, 'english_translation'].fillna('')))
+    previous = previous[~failed]
+    return set(zip(previous['file'], previous['segment_id']))
+
+def _drop_rows(path: Path, drop: set):
+    """Rewrite the output CSV without the given data rows, so retried rows aren't duplicated"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(path, 'r', newline='', encoding='utf-8') as src, \
+         open(tmp_path, 'w', newline='', encoding='utf-8') as dst:
+        reader = csv.reader(src)
+        writer = csv.writer(dst, lineterminator='\n')
+        writer.writerow(next(reader))
+        writer.writerows(row for i, row in enumerate(reader) if i not in drop)
+    os.replace(tmp_path, path)
+
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Translate CF Vanguard tutorial dialogue')
     parser.add_argument('--test', action='store_true', help='Use small test dataset instead of full dataset')
+    parser.add_argument('--restart', action='store_true',
+                        help='Translate every row again instead of resuming from the existing output CSV')
     args = parser.parse_args()
     
     print("🎮 CF Vanguard Tutorial Translation Pipeline")
@@ -211,6 +450,7 @@ def main():
         input_file = base_dir / "tutorial_for_translation.csv"
         output_file = base_dir / "tutorial_translated.csv"
         print(f"📂 Using FULL dataset: {input_file}")
+    cache_file = base_dir / "_translation_cache.json"
     
     if not input_file.exists():
         print(f"❌ Input file not found: {input_file}")
@@ -223,67 +463,80 @@ def main():
     # Initialize translator
     translator = VanguardTranslator()
     print(f"🔗 Using LibreTranslate API: {translator.api_url}")
+    translator.load_cache(cache_file)
+    if translator._cache:
+        print(f"📦 Loaded {len(translator._cache)} cached translations")
+    
+    # Pick up where a previous run stopped
+    done_keys = set() if args.restart else load_previous_results(output_file, translator)
+    if done_keys:
+        remaining = [key not in done_keys for key in zip(df['file'], df['segment_id'])]
+        print(f"⏭️  Resuming: {len(df) - sum(remaining)} segments already in {output_file} (--restart to redo them)")
+        df = df[remaining]
     
     # Process translations
     print("\n🔄 Processing translations...")
     
-    results = []
-    high_quality_count = 0
-    medium_quality_count = 0
-    low_quality_count = 0
+    # One list per output column, kept for the summary below
+    results = {column: [] for column in RESULT_COLUMNS}
+    
+    # Clean and assess quality for the whole column up front
+    cleaned_texts = translator.clean_japanese_column(df['japanese_text']).to_numpy()
+    qualities = translator.assess_quality_column(pd.Series(cleaned_texts)).to_numpy()
+    files = df['file'].to_numpy()
+    segment_ids = df['segment_id'].to_numpy()
+    originals = df['japanese_text'].to_numpy()
+    
+    # Categorize quality and decide what gets translated for all rows at once
+    translate_mask = qualities >= 0.3
+    quality_tiers = np.select([qualities >= 0.7, qualities >= 0.4], ["HIGH", "MEDIUM"], "LOW")
+    statuses = np.where(translate_mask, "TRANSLATED", "SKIPPED")
+    high_quality_count = int((quality_tiers == "HIGH").sum())
+    medium_quality_count = int((quality_tiers == "MEDIUM").sum())
+    low_quality_count = int((quality_tiers == "LOW").sum())
     
     total_segments = len(df)
-    for idx, row in df.iterrows():
-        file_name = row['file']
-        segment_id = row['segment_id']
-        japanese = str(row['japanese_text'])
-        
-        # Clean and assess quality
-        cleaned = translator.clean_japanese_text(japanese)
-        quality = translator.assess_quality(cleaned)
-        
-        # Categorize quality
-        if quality >= 0.7:
-            quality_tier = "HIGH"
-            high_quality_count += 1
-        elif quality >= 0.4:
-            quality_tier = "MEDIUM" 
-            medium_quality_count += 1
-        else:
-            quality_tier = "LOW"
-            low_quality_count += 1
-        
-        # Translate if reasonable quality
-        if quality >= 0.3:
-            translated = translator.translate_text(cleaned)
-            status = "TRANSLATED"
-        else:
-            translated = "[CORRUPTED - SKIP]"
-            status = "SKIPPED"
-        
-        results.append({
-            'file': file_name,
-            'segment_id': segment_id,
-            'japanese_original': japanese,
-            'japanese_cleaned': cleaned,
-            'english_translation': translated,
-            'quality_score': round(quality, 3),
-            'quality_tier': quality_tier,
-            'status': status
-        })
+    save_interval = 10 if args.test else 50
+    
+    # Rows are appended as they're done, so the file always holds every
+    # completed row and nothing is rewritten
+    with open(output_file, 'a' if done_keys else 'w', newline='', encoding='utf-8') as out:
+        writer = csv.writer(out, lineterminator='\n')
+        if not done_keys:
+            writer.writerow(RESULT_COLUMNS)
         
-        print(f"[{idx+1:3d}/{total_segments}] {file_name}:{segment_id} - Quality: {quality:.3f} ({quality_tier}) - {status}")
+        # Work through the rows in groups big enough to keep every concurrent
+        # batch request busy
+        rows_per_batch = translator.batch_size * translator.concurrency
+        for batch_start in range(0, total_segments, rows_per_batch):
+            batch = slice(batch_start, batch_start + rows_per_batch)
         
-        # Save progress every 10 translations for test mode, 50 for full mode
-        save_interval = 10 if args.test else 50
-        if (idx + 1) % save_interval == 0:
-            temp_df = pd.DataFrame(results)
-            temp_df.to_csv(output_file.with_suffix('.tmp.csv'), index=False)
-            print(f"💾 Progress saved ({idx+1}/{total_segments})")
-    
-    # Save final results
-    final_df = pd.DataFrame(results)
-    final_df.to_csv(output_file, index=False)
+            # Only rows of reasonable quality go to the API
+            mask = translate_mask[batch]
+            english = np.full(mask.size, "[CORRUPTED - SKIP]", dtype=object)
+            cached = len(translator._cache)
+            english[mask] = translator.translate_texts(cleaned_texts[batch][mask].tolist())
+            # The cache only changes here, save it once per batch that added to it
+            if len(translator._cache) != cached:
+                translator.save_cache(cache_file)
+            
+            rows = zip(files[batch], segment_ids[batch], originals[batch], cleaned_texts[batch], english,
+                       qualities[batch], quality_tiers[batch], statuses[batch])
+            for done, (file_name, segment_id, japanese, cleaned, translated, quality, quality_tier,
+                       status) in enumerate(rows, batch_start + 1):
+                row = (file_name, segment_id, str(japanese), cleaned, translated,
+                       round(float(quality), 3), quality_tier, status)
+                writer.writerow(row)
+                for column, value in zip(RESULT_COLUMNS, row):
+                    results[column].append(value)
+            
+                print(f"[{done:3d}/{total_segments}] {file_name}:{segment_id} - Quality: {quality:.3f} ({quality_tier}) - {status}")
+            
+                # Save progress every 10 translations for test mode, 50 for full mode
+                if done % save_interval == 0:
+                    out.flush()
+                    os.fsync(out.fileno())
+                    print(f"💾 Progress saved ({done}/{total_segments})")
     
     # Generate summary
     print("\n📊 TRANSLATION SUMMARY")
@@ -292,8 +545,8 @@ def main():
     print(f"High quality (≥0.7): {high_quality_count}")
     print(f"Medium quality (0.4-0.7): {medium_quality_count}")
     print(f"Low quality (<0.4): {low_quality_count}")
-    print(f"Successfully translated: {len([r for r in results if r['status'] == 'TRANSLATED'])}")
-    print(f"Skipped (corrupted): {len([r for r in results if r['status'] == 'SKIPPED'])}")
+    print(f"Successfully translated: {results['status'].count('TRANSLATED')}")
+    print(f"Skipped (corrupted): {results['status'].count('SKIPPED')}")
     print(f"\n✅ Results saved to: {output_file}")
     
     if args.test:
@@ -306,11 +559,13 @@ def main():
     # Show top quality examples
     print("\n🏆 TOP QUALITY TRANSLATIONS (Sample):")
     print("-" * 40)
-    high_quality = [r for r in results if r['quality_tier'] == 'HIGH'][:5]
-    for item in high_quality:
-        print(f"JP: {item['japanese_cleaned'][:50]}...")
-        print(f"EN: {item['english_translation'][:50]}...")
-        print(f"Quality: {item['quality_score']}\n")
+    final_df = pd.DataFrame(results)
+    high_quality = final_df[final_df['quality_tier'] == 'HIGH'].head(5)
+    for cleaned, translated, quality in zip(high_quality['japanese_cleaned'], high_quality['english_translation'],
+                                            high_quality['quality_score']):
+        print(f"JP: {cleaned[:50]}...")
+        print(f"EN: {translated[:50]}...")
+        print(f"Quality: {quality}\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,7 +6,21 @@ Checks what happened during your translation injection process
 
 import sys
 from pathlib import Path
-import csv
+
+import numpy as np
+import pandas as pd
+
+from verify_rtz_translations import open_mapped
+
+# Byte patterns hinting at English text in a binary
+TEST_BYTES = [
+    b'card',
+    b'play',
+    b'zone',
+    b'damage',
+    b'the\x00',  # UTF-16LE "the"
+    b'a\x00n\x00d\x00',  # UTF-16LE "and"
+]
 
 def check_translation_files():
     """Check the status of translation files and process"""
@@ -42,25 +56,26 @@ def check_translation_files():
     if tutorial_csv.exists():
         print("📊 Tutorial Translation Analysis:")
         try:
-            with open(tutorial_csv, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-                
-            print(f"   📝 {len(rows)} translation entries found")
+            # Only the columns checked below; 'file' is in every tutorial CSV
+            # and keeps the row count right when the others are missing
+            df = pd.read_csv(tutorial_csv, dtype=str, keep_default_na=False,
+                             usecols=lambda c: c in ('file', 'translated_text', 'original_text'))
+            
+            print(f"   📝 {len(df)} translation entries found")
             
             # Check for English content
             english_count = 0
             sample_translations = []
             
-            for i, row in enumerate(rows[:10]):  # Check first 10
-                if 'translated_text' in row and row['translated_text']:
-                    translated = row['translated_text']
-                    if any(c.isascii() and c.isalpha() for c in translated):
-                        english_count += 1
-                        if len(sample_translations) < 3:
-                            original = row.get('original_text', 'N/A')[:30]
-                            translated_short = translated[:30]
-                            sample_translations.append(f"'{original}' → '{translated_short}'")
+            if 'translated_text' in df:
+                first = df.head(10)  # Check first 10
+                has_english = first['translated_text'].str.contains(r'[A-Za-z]', regex=True)
+                english_count = int(has_english.sum())
+                
+                for row in first[has_english].head(3).itertuples():
+                    original = getattr(row, 'original_text', 'N/A')[:30]
+                    translated_short = row.translated_text[:30]
+                    sample_translations.append(f"'{original}' → '{translated_short}'")
             
             print(f"   🎯 {english_count} entries contain English text")
             
@@ -106,36 +121,28 @@ def check_translation_files():
             
             # Quick check for any text content
             try:
-                data = bin_file.read_bytes()
+                # Mapped rather than read, every check below works on the buffer
+                with open_mapped(bin_file) as data:
+                    arr = np.frombuffer(data, dtype=np.uint8)
+                    printable = (arr >= 32) & (arr <= 126)
+                    
+                    # Count potential text characters
+                    ascii_count = int(np.count_nonzero(printable))
+                    ascii_percentage = (ascii_count / len(data)) * 100
                 
-                # Count potential text characters
-                ascii_count = sum(1 for b in data if 32 <= b <= 126)
-                ascii_percentage = (ascii_count / len(data)) * 100
+                    # Look for UTF-16LE patterns
+                    # Viewed as (low, high) byte pairs: printable ASCII low, zero high
+                    n = (len(arr) // 2) * 2
+                    utf16_count = int(np.count_nonzero(printable[:n:2] & (arr[1:n:2] == 0)))
+                    del arr  # Views of the mapping must go before it closes
                 
-                # Look for UTF-16LE patterns
-                utf16_count = 0
-                for i in range(0, len(data) - 1, 2):
-                    if data[i + 1] == 0x00 and 32 <= data[i] <= 126:
-                        utf16_count += 1
+                    # Try to find any English words
+                    # find() rather than 'in': on an mmap 'in' doesn't search for byte strings
+                    found_patterns = [p for p in TEST_BYTES if data.find(p) != -1]
                 
                 print(f"      ASCII chars: {ascii_count} ({ascii_percentage:.1f}%)")
                 print(f"      UTF-16LE patterns: {utf16_count}")
                 
-                # Try to find any English words
-                test_bytes = [
-                    b'card',
-                    b'play',
-                    b'zone',
-                    b'damage',
-                    b'the\x00',  # UTF-16LE "the"
-                    b'a\x00n\x00d\x00',  # UTF-16LE "and"
-                ]
-                
-                found_patterns = []
-                for pattern in test_bytes:
-                    if pattern in data:
-                        found_patterns.append(pattern)
-                
                 if found_patterns:
                     print(f"      🎯 Found patterns: {len(found_patterns)} potential English words")
                 else:
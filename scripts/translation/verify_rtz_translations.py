@@ -4,13 +4,32 @@ RTZ Translation Verification Tool
 Checks if English translations are properly embedded in tutorial files
 """
 
+import mmap
+import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
-def search_utf16_text(file_path, search_terms):
-    """Search for UTF-16LE encoded terms in binary file"""
+import numpy as np
+
+@contextmanager
+def open_mapped(file_path):
+    """Read-only mapping of a tutorial binary, also used by translation_debug.py
+    An empty file gives b'' as mmap can't map zero bytes"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _byte_hist(data) -> np.ndarray:
+    """Count of each byte value 0-255 in data"""
+    return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+
+def search_utf16_text(mm, search_terms):
+    """Search for UTF-16LE encoded terms in a mapped binary file"""
     try:
-        data = Path(file_path).read_bytes()
         results = {}
         
         for term in search_terms:
@@ -18,12 +37,12 @@ def search_utf16_text(file_path, search_terms):
             utf16_bytes = term.encode('utf-16le')
             
             # Search for exact matches
-            pos = data.find(utf16_bytes)
+            pos = mm.find(utf16_bytes)
             if pos != -1:
                 results[term] = {
                     'found': True,
                     'position': f'0x{pos:X}',
-                    'context': data[max(0, pos-20):pos+len(utf16_bytes)+20]
+                    'context': mm[max(0, pos-20):pos+len(utf16_bytes)+20]
                 }
             else:
                 results[term] = {'found': False}
@@ -41,26 +60,20 @@ def analyze_file_changes(original_size, current_size):
     else:
         return f"❌ File shrunk by {original_size - current_size} bytes (potential issue)"
 
-def check_english_content(file_path):
-    """Check for English letter patterns in the file"""
+def check_english_content(mm):
+    """Check for English letter patterns in a mapped binary file"""
     try:
-        data = Path(file_path).read_bytes()
-        
         # Count English letters
-        english_chars = sum(1 for b in data if 65 <= b <= 90 or 97 <= b <= 122)
+        hist = _byte_hist(mm)
+        english_chars = int(hist[65:91].sum() + hist[97:123].sum())
         
         # Look for common English words in UTF-16LE
         common_words = ["the", "and", "you", "can", "will", "this", "card", "play"]
-        found_words = []
-        
-        for word in common_words:
-            utf16_word = word.encode('utf-16le')
-            if utf16_word in data:
-                found_words.append(word)
+        found_words = [word for word in common_words if mm.find(word.encode('utf-16le')) != -1]
         
         return {
             'english_char_count': english_chars,
-            'english_percentage': (english_chars / len(data)) * 100,
+            'english_percentage': (english_chars / len(mm)) * 100,
             'common_words_found': found_words
         }
     except Exception as e:
@@ -92,8 +105,13 @@ def main():
         file_size = Path(file_path).stat().st_size
         print(f"   📊 File size: {file_size:,} bytes")
         
-        # Search for specific English terms
-        results = search_utf16_text(file_path, english_terms)
+        # Map the file once for both checks
+        with open_mapped(file_path) as mm:
+            # Search for specific English terms
+            results = search_utf16_text(mm, english_terms)
+            
+            # Check for general English content
+            english_analysis = check_english_content(mm)
         
         found_terms = [term for term, data in results.items() 
                       if isinstance(data, dict) and data.get('found')]
@@ -106,8 +124,6 @@ def main():
         else:
             print(f"   ⚠️  No exact English terms found")
             
-        # Check for general English content
-        english_analysis = check_english_content(file_path)
         if 'error' not in english_analysis:
             char_count = english_analysis['english_char_count']
             percentage = english_analysis['english_percentage']